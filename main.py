@@ -0,0 +1,1008 @@
+import random
+import json
+import os
+import struct
+import atexit
+import math
+import time
+from functools import partial
+from typing import Dict, Optional, Tuple
+import customtkinter as ctk
+import tkinter
+from tkinter import messagebox
+from rules_data import Move, Rules, CLASSIC_RULES, EXTENDED_RULES
+from predictor import FrequencyModel, EnsemblePredictor
+
+# Counter picks and coin flips share one private generator
+_rng = random.Random()
+
+
+# -------------------- Localization --------------------
+# UI strings per language; move names live in rules_data.DISPLAY
+LOCALE: Dict[str, Dict[str, str]] = {
+    'en': {
+        'app_title': 'Smart Game Collection',
+        'menu_title': '🎮 Smart Game Collection',
+        'theme': 'Theme:',
+        'language': 'Language:',
+        'classic_button': 'Classic Rock Paper Scissors (3 moves)',
+        'extended_button': 'Extended Rock Paper Scissors (5 moves)',
+        'coin_button': 'Coin Toss',
+        'stats_button': 'Statistics',
+        'help_button': 'Help',
+        'exit_button': 'Exit',
+        'stats_title': 'Game Statistics',
+        'stats_summary': 'Games played: {total}\nYour wins: {pw}\nComputer wins: {cw}\nTies: {ties}',
+        'help_title': 'Help',
+        'justify': 'left',
+        'settings_title': 'Game Settings',
+        'coin_settings_title': 'Coin Toss Settings',
+        'rounds_prompt': 'Number of rounds (odd number):',
+        'smart_prompt': 'Computer smart level:',
+        'smart_random': 'Random (0)',
+        'smart_simple': 'Simple (1)',
+        'smart_advanced': 'Advanced (2)',
+        'start': 'Start',
+        'error': 'Error',
+        'rounds_error': 'Number of rounds must be odd and positive.',
+        'invalid_input': 'Invalid input.',
+        'time_left': 'Time left: ',
+        'time_left_seconds': 'Time left: {} s',
+        'you_score': 'You: {}',
+        'computer_score': 'Computer: {}',
+        'back_to_menu': 'Back to Menu',
+        'game_over': 'Game Over',
+        'player_champion': '🏆 Congratulations! You are the champion!',
+        'computer_champion': '😞 Computer is the champion! Better luck next time.',
+        'rps_title': 'Rock Paper Scissors',
+        'rps_extended_suffix': ' (Extended)',
+        'round_tie': "It's a tie!",
+        'round_player': '🎉 You win this round!',
+        'round_computer': '💻 Computer wins this round!',
+        'times_up': "⏰ Time's up! ",
+        'rps_result': 'Round {round}: You chose {player}, Computer chose {computer}\n{result}',
+        'coin_title': 'Coin Toss',
+        'heads': 'Heads',
+        'tails': 'Tails',
+        'coin_timeout': "⏰ Time's up! Computer chose {computer}",
+        'coin_player': '🎉 You win this round! (Both {side})',
+        'coin_computer': '💻 Computer wins this round! (You {player}, Computer {computer})',
+        'coin_result': 'Round {round}: {result}',
+        'help_text': """
+        Game Help:
+
+        1. Classic Rock Paper Scissors:
+           - Rock beats Scissors
+           - Scissors beats Paper
+           - Paper beats Rock
+
+        2. Extended Rock Paper Scissors (5 moves):
+           - Rock beats Scissors and Lizard
+           - Paper beats Rock and Spock
+           - Scissors beats Paper and Lizard
+           - Lizard beats Paper and Spock
+           - Spock beats Rock and Scissors
+
+        3. Coin Toss:
+           - Choose Heads or Tails; if it matches the computer's, you win.
+
+        Game Settings:
+        - Number of rounds: Must be odd.
+        - Smart level: 0 = random, 1 = simple prediction (most frequent), 2 = advanced prediction (patterns in your last 1-3 moves).
+        - Timer: You have 10 seconds per round; otherwise you lose the round.
+
+        Game statistics are saved in the game_stats.dat file.
+        """,
+    },
+    'fa': {
+        'app_title': 'مجموعه بازی‌های هوشمند',
+        'menu_title': '🎮 مجموعه بازی‌های هوشمند',
+        'theme': 'تم:',
+        'language': 'زبان:',
+        'classic_button': 'سنگ-کاغذ-قیچی کلاسیک (۳ حرکته)',
+        'extended_button': 'سنگ-کاغذ-قیچی توسعه‌یافته (۵ حرکته)',
+        'coin_button': 'شیر یا خط',
+        'stats_button': 'آمار بازی‌ها',
+        'help_button': 'راهنما',
+        'exit_button': 'خروج',
+        'stats_title': 'آمار بازی‌ها',
+        'stats_summary': 'بازی‌های انجام شده: {total}\nبرد شما: {pw}\nبرد کامپیوتر: {cw}\nمساوی: {ties}',
+        'help_title': 'راهنما',
+        'justify': 'right',
+        'settings_title': 'تنظیمات بازی',
+        'coin_settings_title': 'تنظیمات شیر یا خط',
+        'rounds_prompt': 'تعداد دورهای مسابقه (عدد فرد):',
+        'smart_prompt': 'سطح هوشمندی کامپیوتر:',
+        'smart_random': 'تصادفی (0)',
+        'smart_simple': 'پیش‌بینی ساده (1)',
+        'smart_advanced': 'پیش‌بینی پیشرفته (2)',
+        'start': 'شروع',
+        'error': 'خطا',
+        'rounds_error': 'تعداد دور باید فرد و مثبت باشد.',
+        'invalid_input': 'ورودی نامعتبر.',
+        'time_left': 'زمان باقی‌مانده: ',
+        'time_left_seconds': 'زمان باقی‌مانده: {} ثانیه',
+        'you_score': 'شما: {}',
+        'computer_score': 'کامپیوتر: {}',
+        'back_to_menu': 'بازگشت به منو',
+        'game_over': 'پایان بازی',
+        'player_champion': '🏆 تبریک! شما قهرمان شدید!',
+        'computer_champion': '😞 کامپیوتر قهرمان شد!',
+        'rps_title': 'بازی سنگ-کاغذ-قیچی',
+        'rps_extended_suffix': ' (پیشرفته)',
+        'round_tie': 'مساوی!',
+        'round_player': '🎉 شما برنده این دور شدید!',
+        'round_computer': '💻 کامپیوتر برنده این دور شد!',
+        'times_up': '⏰ زمان تمام شد! ',
+        'rps_result': 'دور {round}: شما {player}، کامپیوتر {computer}\n{result}',
+        'coin_title': 'بازی شیر یا خط',
+        'heads': 'شیر',
+        'tails': 'خط',
+        'coin_timeout': '⏰ زمان تمام شد! کامپیوتر {computer}',
+        'coin_player': '🎉 شما برنده این دور شدید! (هر دو {side})',
+        'coin_computer': '💻 کامپیوتر برنده این دور شد! (شما {player}، کامپیوتر {computer})',
+        'coin_result': 'دور {round}: {result}',
+        'help_text': """
+        راهنمای بازی‌ها:
+
+        1. سنگ-کاغذ-قیچی کلاسیک:
+           - سنگ بر قیچی غلبه می‌کند.
+           - قیچی بر کاغذ غلبه می‌کند.
+           - کاغذ بر سنگ غلبه می‌کند.
+
+        2. سنگ-کاغذ-قیچی توسعه‌یافته (5 حرکته):
+           - سنگ بر قیچی و مارمولک
+           - کاغذ بر سنگ و اسپاک
+           - قیچی بر کاغذ و مارمولک
+           - مارمولک بر کاغذ و اسپاک
+           - اسپاک بر سنگ و قیچی
+
+        3. شیر یا خط:
+           - انتخاب شیر یا خط، اگر با کامپیوتر یکی شود برنده می‌شوید.
+
+        تنظیمات بازی:
+        - تعداد دورها: باید فرد باشد.
+        - سطح هوشمندی: صفر = تصادفی، یک = پیش‌بینی ساده، دو = پیش‌بینی پیشرفته (بر اساس الگوی ۱ تا ۳ حرکت آخر)
+        - تایمر: در هر دور 10 ثانیه فرصت دارید، در غیر این صورت بازنده می‌شوید.
+
+        آمار بازی‌ها در فایل ذخیره می‌شود.
+        """,
+    },
+}
+
+LANGUAGES: Dict[str, str] = {'English': 'en', 'فارسی': 'fa'}
+
+
+# -------------------- Statistics Management --------------------
+class StatsManager:
+    STATS_FILE = "game_stats.dat"
+    # Older versions saved JSON here; read once if no packed file exists yet
+    LEGACY_STATS_FILE = "game_stats.json"
+    RESULT_KEYS = {"player": "player_wins", "computer": "computer_wins", "tie": "ties"}
+    # The file is every counter below, in this order, as little-endian uint64s
+    GAME_TYPES = ("classic", "extended", "coin")
+    COUNTER_KEYS = ("player_wins", "computer_wins", "ties", "games")
+    FILE_FORMAT = struct.Struct("<%dQ" % (len(GAME_TYPES) * len(COUNTER_KEYS)))
+    COUNTER_LIMIT = 1 << 64
+    # Results are written this long after the last one, so a burst of games costs one save
+    FLUSH_DELAY_MS = 2000
+
+    def __init__(self):
+        self._dirty = False
+        self.stats = self.load_stats()
+        self._flush_root = None
+        self._flush_id = None
+
+    def load_stats(self) -> dict:
+        try:
+            with open(self.STATS_FILE, 'rb') as f:
+                values = iter(self.FILE_FORMAT.unpack(f.read()))
+        except FileNotFoundError:
+            return self.load_legacy_stats()
+        except (OSError, struct.error):  # unreadable or corrupt file
+            return self.default_stats()
+        stats = self.default_stats()
+        for game in self.GAME_TYPES:
+            for key in self.COUNTER_KEYS:
+                stats[game][key] = next(values)
+        return stats
+
+    def load_legacy_stats(self) -> dict:
+        stats = self.default_stats()
+        try:
+            with open(self.LEGACY_STATS_FILE, 'rb') as f:
+                data = json.loads(f.read())
+            for game in self.GAME_TYPES:
+                for key in self.COUNTER_KEYS:
+                    value = int(data.get(game, {}).get(key, 0))
+                    # Anything FILE_FORMAT can't pack would make every later save fail
+                    if not 0 <= value < self.COUNTER_LIMIT:
+                        raise ValueError(f"{game}.{key} out of range: {value}")
+                    stats[game][key] = value
+        except (OSError, ValueError, AttributeError, TypeError):  # missing, unreadable or corrupt file
+            return self.default_stats()
+        # Write the packed file at the next flush
+        self._dirty = True
+        return stats
+
+    def default_stats(self) -> dict:
+        return {
+            "classic": {"player_wins": 0, "computer_wins": 0, "ties": 0, "games": 0},
+            "extended": {"player_wins": 0, "computer_wins": 0, "ties": 0, "games": 0},
+            "coin": {"player_wins": 0, "computer_wins": 0, "ties": 0, "games": 0}
+        }
+
+    def save_stats(self):
+        # Write a temp file and swap it in, so an interrupted save never
+        # leaves a half-written stats file behind
+        values = [self.stats[game][key] for game in self.GAME_TYPES for key in self.COUNTER_KEYS]
+        tmp_file = self.STATS_FILE + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            f.write(self.FILE_FORMAT.pack(*values))
+        os.replace(tmp_file, self.STATS_FILE)
+        self._dirty = False
+
+    def schedule_flush(self, root):
+        """Save on root's event loop after FLUSH_DELAY_MS, unless a save is already pending"""
+        if self._flush_id is None:
+            self._flush_root = root
+            self._flush_id = root.after(self.FLUSH_DELAY_MS, self._scheduled_flush)
+
+    def _scheduled_flush(self):
+        self._flush_id = None
+        self.flush()
+
+    def flush(self):
+        """Save now if anything changed since the last save"""
+        if self._flush_id is not None:
+            self._flush_root.after_cancel(self._flush_id)
+            self._flush_id = None
+        if self._dirty:
+            self.save_stats()
+
+    def get_slot(self, game_type: str) -> dict:
+        return self.stats.setdefault(game_type, {"player_wins": 0, "computer_wins": 0, "ties": 0, "games": 0})
+
+    def record(self, slot: dict, result: str):
+        """slot: from get_slot; result: 'player', 'computer', 'tie'"""
+        slot["games"] += 1
+        slot[self.RESULT_KEYS[result]] += 1
+        self._dirty = True
+
+    def get_summary(self, game_type: str, template: str) -> str:
+        """template: a LOCALE 'stats_summary' string"""
+        s = self.stats.get(game_type, {})
+        total = s.get("games", 0)
+        pw = s.get("player_wins", 0)
+        cw = s.get("computer_wins", 0)
+        ties = s.get("ties", 0)
+        return template.format(total=total, pw=pw, cw=cw, ties=ties)
+
+
+# -------------------- Base Game Frame with Timer --------------------
+# Countdown redraw interval; the timeout itself is a separate one-shot after()
+TIMER_TICK_MS = 200
+
+
+class GameFrame(ctk.CTkFrame):
+    def __init__(self, master, best_of: int, game_type: str, timer_seconds: int = 10, **kwargs):
+        super().__init__(master, **kwargs)
+        self.best_of = best_of
+        self.game_type = game_type
+        self.strings = master.strings
+        self.fonts = master.fonts
+        # Look up this game's stats entry once, not on every result
+        self._stats_slot = master.stats_manager.get_slot(game_type)
+        self._record = master.stats_manager.record
+        self._schedule_flush = master.stats_manager.schedule_flush
+        self.timer_seconds = timer_seconds
+        self.player_score = 0
+        self.computer_score = 0
+        # Scores the labels currently show; create_widgets starts them at 0
+        self._shown_player_score = 0
+        self._shown_computer_score = 0
+        self.round = 0
+        self.timer_id = None
+        self.timeout_id = None
+        self.timer_deadline = 0.0
+        self._last_shown = None
+        self.waiting_for_choice = False
+        self.create_widgets()
+        self.pack(fill="both", expand=True)
+
+    def create_widgets(self):
+        self.title_label = ctk.CTkLabel(self, text="", font=self.fonts["title"])
+        self.title_label.pack(pady=10)
+
+        # Timer and progress bar
+        self.timer_frame = ctk.CTkFrame(self)
+        self.timer_frame.pack(pady=5, fill="x", padx=20)
+        # Labels that change every round are bound to variables, so an update is a var.set
+        self.timer_var = ctk.StringVar(value=self.strings["time_left"])
+        self.timer_label = ctk.CTkLabel(self.timer_frame, textvariable=self.timer_var, font=self.fonts["small"])
+        self.timer_label.pack(side="left", padx=5)
+        self.progress_bar = ctk.CTkProgressBar(self.timer_frame, width=250)
+        self.progress_bar.pack(side="left", padx=5)
+        self.progress_bar.set(1.0)
+
+        self.score_frame = ctk.CTkFrame(self)
+        self.score_frame.pack(pady=10)
+        self.player_score_var = ctk.StringVar(value=self.strings["you_score"].format(0))
+        self.player_score_label = ctk.CTkLabel(self.score_frame, textvariable=self.player_score_var, font=self.fonts["button"])
+        self.player_score_label.grid(row=0, column=0, padx=30)
+        self.computer_score_var = ctk.StringVar(value=self.strings["computer_score"].format(0))
+        self.computer_score_label = ctk.CTkLabel(self.score_frame, textvariable=self.computer_score_var, font=self.fonts["button"])
+        self.computer_score_label.grid(row=0, column=1, padx=30)
+
+        self.result_var = ctk.StringVar(value="")
+        self.result_label = ctk.CTkLabel(self, textvariable=self.result_var, font=self.fonts["text"])
+        self.result_label.pack(pady=10)
+
+        self.back_button = ctk.CTkButton(
+            self,
+            text=self.strings["back_to_menu"],
+            command=self.back_to_menu,
+            width=200,
+            height=50,
+            font=self.fonts["text"]
+        )
+        self.back_button.pack(pady=10)
+
+    def update_score_display(self):
+        # Usually only one side scored; leave the other label alone
+        if self.player_score != self._shown_player_score:
+            self._shown_player_score = self.player_score
+            self.player_score_var.set(self.strings["you_score"].format(self.player_score))
+        if self.computer_score != self._shown_computer_score:
+            self._shown_computer_score = self.computer_score
+            self.computer_score_var.set(self.strings["computer_score"].format(self.computer_score))
+
+    def start_timer(self):
+        self.progress_bar.set(1.0)
+        self.waiting_for_choice = True
+        # A single deadline decides the timeout; the tick below only redraws the countdown
+        self.timer_deadline = time.monotonic() + self.timer_seconds
+        self._last_shown = None
+        self.timeout_id = self.after(self.timer_seconds * 1000, self.handle_timeout)
+        self.update_timer()
+
+    def update_timer(self):
+        if not self.waiting_for_choice:
+            return
+        remaining = max(0.0, self.timer_deadline - time.monotonic())
+        self.progress_bar.set(remaining / self.timer_seconds)
+        # The label shows whole seconds, so only touch it when that number changes
+        shown = math.ceil(remaining)
+        if shown != self._last_shown:
+            self._last_shown = shown
+            self.timer_var.set(self.strings["time_left_seconds"].format(shown))
+        if remaining > 0:
+            self.timer_id = self.after(TIMER_TICK_MS, self.update_timer)
+        else:
+            self.timer_id = None
+
+    def handle_timeout(self):
+        self.timeout_id = None
+        self.stop_timer()
+        self.force_loss()
+
+    def force_loss(self):
+        """User forced to lose due to timeout"""
+        pass  # Implement in subclass
+
+    def stop_timer(self):
+        if self.timer_id:
+            self.after_cancel(self.timer_id)
+            self.timer_id = None
+        if self.timeout_id:
+            self.after_cancel(self.timeout_id)
+            self.timeout_id = None
+        self.waiting_for_choice = False
+
+    def check_game_over(self):
+        required = (self.best_of // 2) + 1
+        if self.player_score >= required:
+            messagebox.showinfo(self.strings["game_over"], self.strings["player_champion"])
+            self._record(self._stats_slot, 'player')
+            self._schedule_flush(self.master)
+            self.back_to_menu()
+            return True
+        elif self.computer_score >= required:
+            messagebox.showinfo(self.strings["game_over"], self.strings["computer_champion"])
+            self._record(self._stats_slot, 'computer')
+            self._schedule_flush(self.master)
+            self.back_to_menu()
+            return True
+        return False
+
+    def back_to_menu(self):
+        self.stop_timer()
+        self.master.show_main_menu()
+
+
+# -------------------- Rock Paper Scissors Game --------------------
+class RPSGameFrame(GameFrame):
+    def __init__(self, master, rules: Rules, best_of: int, game_type: str, smart_level: int, timer_seconds: int = 10, **kwargs):
+        super().__init__(master, best_of, game_type, timer_seconds, **kwargs)
+        self.rules = rules
+        self.smart_level = smart_level
+        # Only the number of recorded player moves is needed; the predictor
+        # below holds everything the prediction reads
+        self.history_len = 0
+        n = len(rules.moves)
+        if smart_level == 1:
+            # Simple prediction: most frequent overall move
+            self.predictor = FrequencyModel(n)
+        elif smart_level >= 2:
+            # Advanced prediction: Markov models over the last 1-3 moves,
+            # following whichever has guessed best recently
+            self.predictor = EnsemblePredictor(n)
+        else:
+            self.predictor = None
+            # Random play skips every prediction check: bind the rules' own picker
+            self.get_computer_choice = rules.get_random_move
+        # Per-round text pieces, fetched once per match. Indexed by the outcome
+        # table's value, so 1 -> player, -1 -> computer, 0 -> tie
+        self._round_texts = (self.strings["round_tie"], self.strings["round_player"], self.strings["round_computer"])
+        self._times_up = self.strings["times_up"]
+        self._result_template = self.strings["rps_result"]
+        self._names = rules.display_names
+        self.title_label.configure(text=self.strings["rps_title"] + (self.strings["rps_extended_suffix"] if len(rules.moves) > 3 else ""))
+        self.create_game_widgets()
+        self.start_timer()
+
+    def create_game_widgets(self):
+        self.buttons_frame = ctk.CTkFrame(self)
+        self.buttons_frame.pack(pady=20)
+
+        # Larger buttons for moves
+        for i, move in enumerate(self.rules.moves):
+            btn = ctk.CTkButton(
+                self.buttons_frame,
+                text=f"{self.rules.display_names[move]} ({move.code})",
+                command=partial(self.player_choice, move),
+                width=150,
+                height=60,
+                font=self.fonts["button"],
+                corner_radius=10
+            )
+            row = i // 3
+            col = i % 3
+            btn.grid(row=row, column=col, padx=15, pady=10)
+
+    def get_computer_choice(self) -> Move:
+        """Counter the predicted player move; only used when a predictor is set"""
+        if self.history_len < 3:
+            return self.rules.get_random_move()
+
+        predicted = self.predictor.predict()
+        if predicted is None:
+            return self.rules.get_random_move()
+
+        # One indexed load into the precomputed counter table
+        counters = self.rules.loses_to[predicted]
+        if counters:
+            return _rng.choice(counters)
+        else:
+            return self.rules.get_random_move()
+
+    def player_choice(self, player_move: Move):
+        if not self.waiting_for_choice:
+            return
+        self.stop_timer()
+        self.play_round(player_move)
+
+    def force_loss(self):
+        # The round is lost either way, so skip prediction and show any move
+        computer_move = self.rules.get_random_move()
+        dummy_move = self.rules.moves[0]  # just for display
+        self.play_round(dummy_move, force_loss=True, computer_override=computer_move)
+
+    def play_round(self, player_move: Move, force_loss=False, computer_override: Optional[Move] = None):
+        if computer_override is not None:
+            computer_move = computer_override
+        else:
+            computer_move = self.get_computer_choice()
+
+        if not force_loss:
+            self.history_len += 1
+            if self.predictor is not None:
+                self.predictor.update(player_move)
+
+        if force_loss:
+            # A timed-out round is the computer's whatever the moves are; the
+            # placeholder player move is never scored
+            result_text = self._times_up + self._round_texts[-1]
+            self.computer_score += 1
+        else:
+            # Precomputed result table: 1 player wins, -1 computer wins, 0 tie
+            outcome = self.rules.outcome[player_move][computer_move]
+            result_text = self._round_texts[outcome]
+            if outcome > 0:
+                self.player_score += 1
+            elif outcome < 0:
+                self.computer_score += 1
+
+        self.round += 1
+        self.update_score_display()
+
+        self.result_var.set(
+            self._result_template.format(
+                round=self.round,
+                player=self._names[player_move],
+                computer=self._names[computer_move],
+                result=result_text
+            )
+        )
+
+        if not self.check_game_over():
+            self.start_timer()
+
+    def check_game_over(self):
+        if super().check_game_over():
+            return True
+        return False
+
+
+# -------------------- Coin Toss Game --------------------
+# Coin flips drawn per getrandbits call
+FLIP_BLOCK_BITS = 64
+
+
+class CoinTossGameFrame(GameFrame):
+    def __init__(self, master, best_of: int, game_type: str, timer_seconds: int = 10, **kwargs):
+        super().__init__(master, best_of, game_type, timer_seconds, **kwargs)
+        self.title_label.configure(text=self.strings["coin_title"])
+        self.sides = {'h': self.strings["heads"], 't': self.strings["tails"]}
+        # Per-round templates, fetched once per match
+        self._timeout_template = self.strings["coin_timeout"]
+        self._player_template = self.strings["coin_player"]
+        self._computer_template = self.strings["coin_computer"]
+        self._result_template = self.strings["coin_result"]
+        # A coin flip is a single random bit indexing a fixed tuple. Bits are
+        # drawn a block at a time, so a round reads one bit and best_of can be
+        # any size without a big upfront draw
+        self._coin_sides = ('h', 't')
+        self._flips = _rng.getrandbits(FLIP_BLOCK_BITS)
+        self.create_game_widgets()
+        self.start_timer()
+
+    def create_game_widgets(self):
+        self.buttons_frame = ctk.CTkFrame(self)
+        self.buttons_frame.pack(pady=20)
+
+        ctk.CTkButton(
+            self.buttons_frame,
+            text=f"{self.sides['h']} (h)",
+            command=partial(self.player_choice, 'h'),
+            width=200,
+            height=70,
+            font=self.fonts["large"],
+            corner_radius=10
+        ).grid(row=0, column=0, padx=20, pady=10)
+
+        ctk.CTkButton(
+            self.buttons_frame,
+            text=f"{self.sides['t']} (t)",
+            command=partial(self.player_choice, 't'),
+            width=200,
+            height=70,
+            font=self.fonts["large"],
+            corner_radius=10
+        ).grid(row=0, column=1, padx=20, pady=10)
+
+    def get_computer_choice(self) -> str:
+        return self._coin_sides[(self._flips >> (self.round % FLIP_BLOCK_BITS)) & 1]
+
+    def player_choice(self, player_choice: str):
+        if not self.waiting_for_choice:
+            return
+        self.stop_timer()
+        self.play_round(player_choice)
+
+    def force_loss(self):
+        computer_choice = self.get_computer_choice()
+        self.play_round(None, force_loss=True, computer_override=computer_choice)
+
+    def play_round(self, player_choice: Optional[str], force_loss=False, computer_override=None):
+        if computer_override:
+            computer_choice = computer_override
+        else:
+            computer_choice = self.get_computer_choice()
+
+        if force_loss or player_choice is None:
+            result_text = self._timeout_template.format(computer=self.sides[computer_choice])
+            self.computer_score += 1
+        else:
+            if player_choice == computer_choice:
+                result_text = self._player_template.format(side=self.sides[computer_choice])
+                self.player_score += 1
+            else:
+                result_text = self._computer_template.format(
+                    player=self.sides[player_choice], computer=self.sides[computer_choice]
+                )
+                self.computer_score += 1
+
+        self.round += 1
+        if self.round % FLIP_BLOCK_BITS == 0:
+            self._flips = _rng.getrandbits(FLIP_BLOCK_BITS)
+        self.update_score_display()
+        self.result_var.set(self._result_template.format(round=self.round, result=result_text))
+
+        if not self.check_game_over():
+            self.start_timer()
+
+    def check_game_over(self):
+        if super().check_game_over():
+            return True
+        return False
+
+
+# -------------------- Settings Dialog --------------------
+class SettingsDialog(ctk.CTkToplevel):
+    """Modal rounds (and optionally smart level) prompt. Built once and hidden
+    between uses; ask() shows it again with fresh defaults."""
+
+    def __init__(self, master, title_key: str, geometry: str, with_smart: bool):
+        super().__init__(master)
+        self.withdraw()
+        self.strings = master.strings
+        fonts = master.fonts
+        self.title(self.strings[title_key])
+        self.geometry(geometry)
+        self.transient(master)
+        # Closing the window cancels instead of destroying it
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+        # tkwait variable ignores window destruction, so a pending ask() must
+        # be woken by hand if the app closes underneath it
+        self.bind("<Destroy>", self.on_destroy, add="+")
+
+        self.best_of_var = ctk.IntVar(value=3)
+        self.smart_var = ctk.IntVar(value=1) if with_smart else None
+        self.done_var = ctk.IntVar(value=0)
+        self.result: Optional[Tuple[int, int]] = None
+
+        ctk.CTkLabel(self, text=self.strings["rounds_prompt"], font=fonts["small"]).pack(pady=10)
+        best_of_entry = ctk.CTkEntry(self, textvariable=self.best_of_var, width=100, font=fonts["small"])
+        best_of_entry.pack(pady=5)
+
+        if with_smart:
+            ctk.CTkLabel(self, text=self.strings["smart_prompt"], font=fonts["small"]).pack(pady=10)
+            smart_frame = ctk.CTkFrame(self)
+            smart_frame.pack(pady=5)
+            ctk.CTkRadioButton(smart_frame, text=self.strings["smart_random"], variable=self.smart_var, value=0, font=fonts["radio"]).pack(side="left", padx=10)
+            ctk.CTkRadioButton(smart_frame, text=self.strings["smart_simple"], variable=self.smart_var, value=1, font=fonts["radio"]).pack(side="left", padx=10)
+            ctk.CTkRadioButton(smart_frame, text=self.strings["smart_advanced"], variable=self.smart_var, value=2, font=fonts["radio"]).pack(side="left", padx=10)
+
+        ctk.CTkButton(self, text=self.strings["start"], command=self.confirm, width=150, height=40, font=fonts["small"]).pack(pady=20 if with_smart else 10)
+
+    def ask(self) -> Optional[Tuple[int, int]]:
+        """Show the dialog and block until it is confirmed or closed.
+        Returns (best_of, smart_level), or None if cancelled; smart_level is 0 without the smart prompt."""
+        self.best_of_var.set(3)
+        if self.smart_var is not None:
+            self.smart_var.set(1)
+        self.result = None
+        self.deiconify()
+        self.grab_set()
+        self.master.wait_variable(self.done_var)
+        return self.result
+
+    def confirm(self):
+        try:
+            best = self.best_of_var.get()
+            if best <= 0 or best % 2 == 0:
+                messagebox.showerror(self.strings["error"], self.strings["rounds_error"])
+                return
+            smart = self.smart_var.get() if self.smart_var is not None else 0
+        except (tkinter.TclError, ValueError):  # entry text is not an integer
+            messagebox.showerror(self.strings["error"], self.strings["invalid_input"])
+            return
+        self.result = (best, smart)
+        self.close()
+
+    def cancel(self):
+        self.result = None
+        self.close()
+
+    def close(self):
+        self.grab_release()
+        self.withdraw()
+        self.done_var.set(self.done_var.get() + 1)
+
+    def on_destroy(self, event):
+        # Children's <Destroy> events reach this binding too; only react to the dialog's own
+        if event.widget is self:
+            self.result = None
+            self.done_var.set(self.done_var.get() + 1)
+
+
+# -------------------- Main Application --------------------
+# Every text style in the app; App turns each into one CTkFont at startup
+FONT_SPECS: Dict[str, Dict[str, object]] = {
+    "menu_title": {"family": "Arial", "size": 28, "weight": "bold"},
+    "title": {"family": "Arial", "size": 24, "weight": "bold"},
+    "large": {"family": "Arial", "size": 20, "weight": "bold"},
+    "button": {"family": "Arial", "size": 18, "weight": "bold"},
+    "text": {"family": "Arial", "size": 16},
+    "small": {"family": "Arial", "size": 14},
+    "radio": {"family": "Arial", "size": 13},
+}
+
+
+class App(ctk.CTk):
+    def __init__(self):
+        super().__init__()
+        self.lang = 'en'
+        self.strings = LOCALE[self.lang]
+        self.title(self.strings["app_title"])
+        self.geometry("800x700")
+        ctk.set_appearance_mode("dark")
+        ctk.set_default_color_theme("blue")
+        # Shared font objects; every widget reuses these instead of building its own from a tuple
+        self.fonts = {name: ctk.CTkFont(**spec) for name, spec in FONT_SPECS.items()}
+
+        self.stats_manager = StatsManager()
+        # Stats are written shortly after a game ends and flushed again on exit
+        atexit.register(self.stats_manager.flush)
+        # Route the window's close button through destroy so the flush runs before Tk goes away
+        self.protocol("WM_DELETE_WINDOW", self.destroy)
+        self.main_menu_frame = None
+        self.current_game_frame = None
+        # Secondary windows for the current language; built hidden, shown on demand
+        self.stats_window = None
+        self.stats_labels: Dict[str, ctk.CTkLabel] = {}
+        self.help_window = None
+        self.rps_settings_dialog = None
+        self.coin_settings_dialog = None
+
+        self.show_main_menu()
+        # Build them once the main window is up, so opening one later is instant
+        self.after_idle(self.build_secondary_windows)
+
+    def show_main_menu(self):
+        if self.current_game_frame:
+            self.current_game_frame.destroy()
+            self.current_game_frame = None
+
+        # The menu is built once and only hidden while a game is running
+        if self.main_menu_frame is None:
+            self.build_main_menu()
+        self.main_menu_frame.pack(fill="both", expand=True)
+
+    def build_main_menu(self):
+        self.main_menu_frame = ctk.CTkFrame(self)
+
+        title = ctk.CTkLabel(self.main_menu_frame, text=self.strings["menu_title"], font=self.fonts["menu_title"])
+        title.pack(pady=40)
+
+        # Theme and language selection
+        theme_frame = ctk.CTkFrame(self.main_menu_frame)
+        theme_frame.pack(pady=10)
+        ctk.CTkLabel(theme_frame, text=self.strings["theme"], font=self.fonts["text"]).pack(side="left", padx=5)
+        theme_var = ctk.StringVar(value=ctk.get_appearance_mode())
+        theme_menu = ctk.CTkOptionMenu(theme_frame, values=["dark", "light", "system"],
+                                       command=self.change_theme, variable=theme_var,
+                                       width=150, font=self.fonts["small"])
+        theme_menu.pack(side="left", padx=5)
+        ctk.CTkLabel(theme_frame, text=self.strings["language"], font=self.fonts["text"]).pack(side="left", padx=5)
+        lang_var = ctk.StringVar(value=next(name for name, lang in LANGUAGES.items() if lang == self.lang))
+        lang_menu = ctk.CTkOptionMenu(theme_frame, values=list(LANGUAGES),
+                                      command=self.change_language, variable=lang_var,
+                                      width=150, font=self.fonts["small"])
+        lang_menu.pack(side="left", padx=5)
+
+        # Game buttons (larger)
+        btn_classic = ctk.CTkButton(
+            self.main_menu_frame,
+            text=self.strings["classic_button"],
+            command=self.start_classic,
+            width=400,
+            height=70,
+            font=self.fonts["button"],
+            corner_radius=10
+        )
+        btn_classic.pack(pady=15)
+
+        btn_extended = ctk.CTkButton(
+            self.main_menu_frame,
+            text=self.strings["extended_button"],
+            command=self.start_extended,
+            width=400,
+            height=70,
+            font=self.fonts["button"],
+            corner_radius=10
+        )
+        btn_extended.pack(pady=15)
+
+        btn_coin = ctk.CTkButton(
+            self.main_menu_frame,
+            text=self.strings["coin_button"],
+            command=self.start_coin_toss,
+            width=400,
+            height=70,
+            font=self.fonts["button"],
+            corner_radius=10
+        )
+        btn_coin.pack(pady=15)
+
+        # Statistics button
+        btn_stats = ctk.CTkButton(
+            self.main_menu_frame,
+            text=self.strings["stats_button"],
+            command=self.show_stats,
+            width=350,
+            height=60,
+            font=self.fonts["text"],
+            fg_color="gray",
+            corner_radius=10
+        )
+        btn_stats.pack(pady=8)
+
+        # Help button
+        btn_help = ctk.CTkButton(
+            self.main_menu_frame,
+            text=self.strings["help_button"],
+            command=self.show_help,
+            width=350,
+            height=60,
+            font=self.fonts["text"],
+            fg_color="gray",
+            corner_radius=10
+        )
+        btn_help.pack(pady=8)
+
+        btn_exit = ctk.CTkButton(
+            self.main_menu_frame,
+            text=self.strings["exit_button"],
+            command=self.quit,
+            width=350,
+            height=60,
+            font=self.fonts["button"],
+            fg_color="red",
+            hover_color="darkred",
+            corner_radius=10
+        )
+        btn_exit.pack(pady=20)
+
+    def destroy(self):
+        # Flush stats when the window closes; atexit covers exits that
+        # never reach destroy
+        try:
+            self.stats_manager.flush()
+            atexit.unregister(self.stats_manager.flush)
+        except OSError:  # unwritable directory, full disk, ...
+            pass  # the atexit hook stays registered and tries once more
+        finally:
+            # Never let a failed save keep the window from closing
+            super().destroy()
+
+    def change_theme(self, choice):
+        ctk.set_appearance_mode(choice)
+
+    def change_language(self, choice):
+        self.lang = LANGUAGES[choice]
+        self.strings = LOCALE[self.lang]
+        self.title(self.strings["app_title"])
+        self.main_menu_frame.destroy()
+        self.main_menu_frame = None
+        # The hidden windows hold the old language's text; rebuild them too
+        for window in (self.stats_window, self.help_window, self.rps_settings_dialog, self.coin_settings_dialog):
+            if window is not None:
+                window.destroy()
+        self.stats_window = None
+        self.stats_labels = {}
+        self.help_window = None
+        self.rps_settings_dialog = None
+        self.coin_settings_dialog = None
+        self.show_main_menu()
+        self.after_idle(self.build_secondary_windows)
+
+    def build_secondary_windows(self):
+        """Build whichever of the stats, help and settings windows are missing, hidden"""
+        if self.stats_window is None:
+            self.build_stats_window()
+        if self.help_window is None:
+            self.build_help_window()
+        if self.rps_settings_dialog is None:
+            self.rps_settings_dialog = SettingsDialog(self, "settings_title", "450x350", with_smart=True)
+        if self.coin_settings_dialog is None:
+            self.coin_settings_dialog = SettingsDialog(self, "coin_settings_title", "350x200", with_smart=False)
+
+    def build_stats_window(self):
+        self.stats_window = ctk.CTkToplevel(self)
+        self.stats_window.withdraw()
+        self.stats_window.title(self.strings["stats_title"])
+        self.stats_window.geometry("450x450")
+        self.stats_window.transient(self)
+        self.stats_window.protocol("WM_DELETE_WINDOW", self.stats_window.withdraw)
+
+        notebook = ctk.CTkTabview(self.stats_window)
+        notebook.pack(fill="both", expand=True)
+
+        for game in ["classic", "extended", "coin"]:
+            tab = notebook.add(game)
+            label = ctk.CTkLabel(tab, text="", font=self.fonts["text"], justify=self.strings["justify"])
+            label.pack(pady=30)
+            self.stats_labels[game] = label
+
+    def build_help_window(self):
+        self.help_window = ctk.CTkToplevel(self)
+        self.help_window.withdraw()
+        self.help_window.title(self.strings["help_title"])
+        self.help_window.geometry("550x500")
+        self.help_window.transient(self)
+        self.help_window.protocol("WM_DELETE_WINDOW", self.help_window.withdraw)
+
+        text = self.strings["help_text"]
+        label = ctk.CTkLabel(self.help_window, text=text, font=self.fonts["small"], justify=self.strings["justify"])
+        label.pack(pady=20, padx=20)
+
+    def show_stats(self):
+        if self.stats_window is None:
+            self.build_secondary_windows()
+        # Stats change between openings, so only the labels are refreshed
+        for game, label in self.stats_labels.items():
+            label.configure(text=self.stats_manager.get_summary(game, self.strings["stats_summary"]))
+        self.stats_window.deiconify()
+        self.stats_window.lift()
+
+    def show_help(self):
+        if self.help_window is None:
+            self.build_secondary_windows()
+        self.help_window.deiconify()
+        self.help_window.lift()
+
+    def get_game_settings(self) -> Tuple[Optional[int], Optional[int]]:
+        if self.rps_settings_dialog is None:
+            self.build_secondary_windows()
+        result = self.rps_settings_dialog.ask()
+        return result if result is not None else (None, None)
+
+    def start_classic(self):
+        best_of, smart = self.get_game_settings()
+        if best_of is None:
+            return
+        self.main_menu_frame.pack_forget()
+        self.current_game_frame = RPSGameFrame(
+            self,
+            rules=CLASSIC_RULES[self.lang],
+            best_of=best_of,
+            game_type="classic",
+            smart_level=smart,
+            timer_seconds=10
+        )
+
+    def start_extended(self):
+        best_of, smart = self.get_game_settings()
+        if best_of is None:
+            return
+        self.main_menu_frame.pack_forget()
+        self.current_game_frame = RPSGameFrame(
+            self,
+            rules=EXTENDED_RULES[self.lang],
+            best_of=best_of,
+            game_type="extended",
+            smart_level=smart,
+            timer_seconds=10
+        )
+
+    def start_coin_toss(self):
+        if self.coin_settings_dialog is None:
+            self.build_secondary_windows()
+        result = self.coin_settings_dialog.ask()
+        if result is None:
+            return
+
+        self.main_menu_frame.pack_forget()
+        self.current_game_frame = CoinTossGameFrame(
+            self,
+            best_of=result[0],
+            game_type="coin",
+            timer_seconds=10
+        )
+
+
+if __name__ == "__main__":
+    app = App()
+    app.mainloop()
\ No newline at end of file
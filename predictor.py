@@ -0,0 +1,93 @@
+from collections import deque
+from typing import List, Optional, Tuple
+
+
+# -------------------- Move Prediction --------------------
+# Models see moves as plain ints (Move values) and predict the player's next one.
+
+def predict_index(counts: List[int], fallback: Optional[int]) -> Optional[int]:
+    """Index of the highest count, or fallback if nothing has been counted yet"""
+    # Two C-level passes, no per-element key callback
+    top = max(counts)
+    return counts.index(top) if top else fallback
+
+
+class FrequencyModel:
+    """Predicts the player's most frequent move so far"""
+    __slots__ = ('counts',)
+
+    def __init__(self, n_moves: int):
+        self.counts = [0] * n_moves
+
+    def predict(self) -> Optional[int]:
+        return predict_index(self.counts, None)
+
+    def update(self, move: int):
+        self.counts[move] += 1
+
+
+class MarkovModel:
+    """Predicts the move that most often followed the player's last `order` moves"""
+    __slots__ = ('n_moves', 'order', 'context', 'span', 'seen', 'table')
+
+    def __init__(self, n_moves: int, order: int):
+        self.n_moves = n_moves
+        self.order = order
+        # The last `order` moves packed as one base-n_moves int, oldest move most significant
+        self.context = 0
+        self.span = n_moves ** order
+        self.seen = 0
+        # Indexed by context: counts of the move that came next, None until that context is seen
+        self.table: List[Optional[List[int]]] = [None] * self.span
+
+    def predict(self) -> Optional[int]:
+        if self.seen < self.order:
+            return None
+        counts = self.table[self.context]
+        if counts is None:
+            return None
+        return predict_index(counts, None)
+
+    def update(self, move: int):
+        if self.seen < self.order:
+            self.seen += 1
+        else:
+            counts = self.table[self.context]
+            if counts is None:
+                counts = self.table[self.context] = [0] * self.n_moves
+            counts[move] += 1
+        # Shift the new move in and drop the oldest one
+        self.context = (self.context * self.n_moves + move) % self.span
+
+
+class EnsemblePredictor:
+    """Runs several models and follows the one that was right most often
+    over the last `focus` rounds"""
+    __slots__ = ('models', 'hits', 'scores', 'focus')
+
+    def __init__(self, n_moves: int, orders: Tuple[int, ...] = (3, 2, 1), focus: int = 10):
+        # Longer contexts come first so they win ties against shorter ones
+        self.models = [MarkovModel(n_moves, k) for k in orders] + [FrequencyModel(n_moves)]
+        self.hits = [deque(maxlen=focus) for _ in self.models]
+        # Running sum of each hits window, kept in step with the deque
+        self.scores = [0] * len(self.models)
+        self.focus = focus
+
+    def predict(self) -> Optional[int]:
+        best, best_score = None, -1
+        for model, score in zip(self.models, self.scores):
+            if score > best_score:
+                predicted = model.predict()
+                if predicted is not None:
+                    best, best_score = predicted, score
+        return best
+
+    def update(self, move: int):
+        scores = self.scores
+        for i, (model, hits) in enumerate(zip(self.models, self.hits)):
+            hit = model.predict() == move
+            if len(hits) == self.focus:
+                scores[i] -= hits[0]
+            hits.append(hit)
+            scores[i] += hit
+            model.update(move)
@@ -0,0 +1,130 @@
+import random
+from typing import List, Dict, Optional, Tuple
+from enum import IntEnum
+
+
+# Random moves come from a module-private generator
+_rng = random.Random()
+
+
+# -------------------- Display Names --------------------
+# Move display names per language, keyed by Move.name.lower()
+DISPLAY: Dict[str, Dict[str, str]] = {
+    'en': {
+        'rock': 'Rock',
+        'paper': 'Paper',
+        'scissors': 'Scissors',
+        'lizard': 'Lizard',
+        'spock': 'Spock',
+    },
+    'fa': {
+        'rock': 'سنگ',
+        'paper': 'کاغذ',
+        'scissors': 'قیچی',
+        'lizard': 'مارمولک',
+        'spock': 'اسپاک',
+    },
+}
+
+
+# -------------------- Game Logic --------------------
+class Move(IntEnum):
+    ROCK = 0
+    PAPER = 1
+    SCISSORS = 2
+    LIZARD = 3
+    SPOCK = 4
+
+    @property
+    def code(self) -> str:
+        return MOVE_CODES[self]
+
+
+# Keyboard code for each Move value; classic rules use the first three
+MOVE_CODES: Tuple[str, ...] = ('r', 'p', 's', 'l', 'k')
+
+
+class Rules:
+    __slots__ = ('moves', 'move_by_code', 'display_names', 'beats', 'loses_to', 'beats_mask', 'outcome')
+
+    def __init__(self, moves: List[Move], beats_map: Dict[str, List[str]], lang: str = 'en'):
+        self.moves: Tuple[Move, ...] = tuple(moves)
+        self.move_by_code = {m.code: m for m in moves}
+        # Indexed by move value; moves must be numbered 0..len(moves)-1
+        self.display_names: List[str] = [DISPLAY[lang][m.name.lower()] for m in moves]
+        beats: List[List[Move]] = [[] for _ in moves]
+        loses_to: List[List[Move]] = [[] for _ in moves]
+        # beats_mask[i] has bit j set when move i beats move j
+        self.beats_mask: List[int] = [0] * len(moves)
+        for winner_code, loser_codes in beats_map.items():
+            winner = self.move_by_code[winner_code]
+            for loser_code in loser_codes:
+                loser = self.move_by_code[loser_code]
+                beats[winner].append(loser)
+                loses_to[loser].append(winner)
+                self.beats_mask[winner] |= 1 << loser
+        # Frozen once built: every match shares these, and choice() takes tuples directly
+        self.beats: Tuple[Tuple[Move, ...], ...] = tuple(map(tuple, beats))
+        self.loses_to: Tuple[Tuple[Move, ...], ...] = tuple(map(tuple, loses_to))
+        # outcome[a][b]: 1 if a beats b, -1 if b beats a, 0 for a tie
+        self.outcome: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(self._outcome(a, b) for b in moves) for a in moves
+        )
+
+    def _outcome(self, move1: Move, move2: Move) -> int:
+        winner = self.get_winner(move1, move2)
+        if winner is None:
+            return 0
+        return 1 if winner == move1 else -1
+
+    def get_winner(self, move1: Move, move2: Move) -> Optional[Move]:
+        if move1 == move2:
+            return None
+        if self.beats_mask[move1] & (1 << move2):
+            return move1
+        if self.beats_mask[move2] & (1 << move1):
+            return move2
+        raise ValueError(f"No rule defined between {move1.code} and {move2.code}")
+
+    def get_counter(self, move: Move) -> Tuple[Move, ...]:
+        return self.loses_to[move]
+
+    def get_random_move(self) -> Move:
+        return _rng.choice(self.moves)
+
+
+def get_classic_rules(lang: str = 'en') -> Rules:
+    moves = [
+        Move.ROCK,
+        Move.PAPER,
+        Move.SCISSORS
+    ]
+    beats_map = {
+        'r': ['s'],
+        'p': ['r'],
+        's': ['p']
+    }
+    return Rules(moves, beats_map, lang)
+
+
+def get_extended_rules(lang: str = 'en') -> Rules:
+    moves = [
+        Move.ROCK,
+        Move.PAPER,
+        Move.SCISSORS,
+        Move.LIZARD,
+        Move.SPOCK
+    ]
+    beats_map = {
+        'r': ['s', 'l'],
+        'p': ['r', 'k'],
+        's': ['p', 'l'],
+        'l': ['p', 'k'],
+        'k': ['r', 's']
+    }
+    return Rules(moves, beats_map, lang)
+
+
+# Rules are immutable, so each set is built once per language at import and shared by every match
+CLASSIC_RULES: Dict[str, Rules] = {lang: get_classic_rules(lang) for lang in DISPLAY}
+EXTENDED_RULES: Dict[str, Rules] = {lang: get_extended_rules(lang) for lang in DISPLAY}